@@ -1,45 +1,41 @@
 """
-Pytest configuration and fixtures for the Mergington High School API tests.
+Pytest configuration for the Mergington High School API tests.
 """
 
-import sys
-from pathlib import Path
+import re
 
 import pytest
-from fastapi.testclient import TestClient
-
-# Add the src directory to the path so we can import the app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from app import app
-
-
-@pytest.fixture
-def client():
-    """Provides a test client for the FastAPI application."""
-    return TestClient(app)
-
-
-@pytest.fixture
-def sample_activities():
-    """Provides sample activity data for testing."""
-    return {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
+
+pytest_plugins = ["pytester"]
+
+# A ``-k`` expression consisting of one bare word, e.g. ``-k signup``
+_SIMPLE_KEYWORD = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_KEYWORD_OPERATORS = {"and", "or", "not"}
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Deselects items for a single-word ``-k`` before the other plugins see them.
+
+    An item is kept when the word is a case-insensitive substring of any of its
+    keywords, extra keywords or marker names. That covers every name pytest's
+    own keyword matcher checks, so this never drops an item pytest would keep;
+    anything more complex than one bare word is left to pytest.
+    """
+    keyword = config.getoption("keyword")
+    if not _SIMPLE_KEYWORD.match(keyword) or keyword in _KEYWORD_OPERATORS:
+        return
+
+    keyword = keyword.lower()
+    selected, deselected = [], []
+    for item in items:
+        names = set(item.keywords) | item.listextrakeywords()
+        names.update(mark.name for mark in item.iter_markers())
+        if any(keyword in name.lower() for name in names):
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
@@ -1,16 +1,117 @@
 """
 Tests for the Mergington High School API endpoints.
+
+FastAPI and the application are imported inside the fixtures so that
+collection (e.g. ``pytest --collect-only`` or ``-k`` filtering) does not pay
+for loading them.
 """
 
+import copy
+import functools
+
+import orjson
 import pytest
 
+# Request paths, with activity names already percent-encoded
+ACTIVITIES_URL = "/activities"
+CHESS_SIGNUP = "/activities/Chess%20Club/signup"
+CHESS_UNREGISTER = "/activities/Chess%20Club/unregister"
+PROGRAMMING_SIGNUP = "/activities/Programming%20Class/signup"
+PROGRAMMING_UNREGISTER = "/activities/Programming%20Class/unregister"
+GYM_SIGNUP = "/activities/Gym%20Class/signup"
+GYM_UNREGISTER = "/activities/Gym%20Class/unregister"
+NONEXISTENT_SIGNUP = "/activities/Nonexistent%20Activity/signup"
+NONEXISTENT_UNREGISTER = "/activities/Nonexistent%20Activity/unregister"
+
+
+def _json(response):
+    """Decodes a response body with orjson rather than the stdlib json module."""
+    return orjson.loads(response.content)
+
+
+@functools.lru_cache(maxsize=1)
+def _asgi_transport():
+    """Builds the in-process transport to the app once.
+
+    The client fixture is session-scoped today; the cache keeps a single
+    transport shared by every client should that scope ever be narrowed.
+    """
+    import httpx
+
+    from app import app
+
+    return httpx.ASGITransport(app=app)
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """Provides an async HTTP client bound in-process to the app, shared across the session."""
+    import httpx
+
+    transport = _asgi_transport()
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def activities_adapter():
+    """Validator for the GET /activities payload, compiled once per session."""
+    from pydantic import BaseModel, TypeAdapter
+
+    class Activity(BaseModel):
+        description: str
+        schedule: str
+        max_participants: int
+        participants: list[str]
+
+    return TypeAdapter(dict[str, Activity])
+
+
+@pytest.fixture(scope="session")
+def initial_activities():
+    """Pristine copy of the seed data, captured before any test can mutate it."""
+    import app as app_module
+
+    return copy.deepcopy(app_module.activities)
+
+
+@pytest.fixture
+def activities():
+    """The application's in-memory activities, for asserting on server state directly."""
+    import app as app_module
+
+    return app_module.activities
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(initial_activities):
+    """Resets the in-memory activities to the seed data around each test.
+
+    Every test starts from the same state regardless of order, so the suite
+    stays safe to run under pytest-xdist should it grow large enough to need it.
+    """
+    import app as app_module
+
+    app_module.activities.clear()
+    app_module.activities.update(copy.deepcopy(initial_activities))
+    yield
+    app_module.activities.clear()
+    app_module.activities.update(copy.deepcopy(initial_activities))
+
 
 class TestRoot:
     """Tests for the root endpoint."""
 
-    def test_root_redirects_to_static(self, client):
+    def test_root_redirects_to_static(self):
         """Test that the root endpoint redirects to /static/index.html."""
-        response = client.get("/", follow_redirects=False)
+        from fastapi.responses import RedirectResponse
+
+        from app import app
+
+        # Call the route's endpoint directly; no request is needed for a constant redirect
+        route = next(r for r in app.routes if getattr(r, "path", None) == "/")
+        response = route.endpoint()
+        assert isinstance(response, RedirectResponse)
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -18,33 +119,26 @@ class TestRoot:
 class TestGetActivities:
     """Tests for the get activities endpoint."""
 
-    def test_get_all_activities(self, client):
+    async def test_get_all_activities(self, client):
         """Test retrieving all activities."""
-        response = client.get("/activities")
+        response = await client.get(ACTIVITIES_URL)
         assert response.status_code == 200
         
-        activities = response.json()
+        activities = _json(response)
         assert isinstance(activities, dict)
         assert "Chess Club" in activities
         assert "Programming Class" in activities
         assert "Gym Class" in activities
 
-    def test_activities_have_required_fields(self, client):
+    async def test_activities_have_required_fields(self, client, activities_adapter):
         """Test that activities have all required fields."""
-        response = client.get("/activities")
-        activities = response.json()
-        
-        for activity_name, activity_data in activities.items():
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
-            assert isinstance(activity_data["participants"], list)
-
-    def test_activities_have_participants(self, client):
+        response = await client.get(ACTIVITIES_URL)
+        activities_adapter.validate_json(response.content, strict=True)
+
+    async def test_activities_have_participants(self, client):
         """Test that activities have participants."""
-        response = client.get("/activities")
-        activities = response.json()
+        response = await client.get(ACTIVITIES_URL)
+        activities = _json(response)
         
         chess_club = activities["Chess Club"]
         assert len(chess_club["participants"]) == 2
@@ -55,177 +149,165 @@ class TestGetActivities:
 class TestSignup:
     """Tests for the signup endpoint."""
 
-    def test_signup_new_participant(self, client):
-        """Test signing up a new participant for an activity."""
-        response = client.post(
-            "/activities/Chess%20Club/signup",
-            params={"email": "alice@mergington.edu"}
+    @pytest.mark.parametrize(
+        "url, email, status_code, expected_bytes",
+        [
+            (CHESS_SIGNUP, "alice@mergington.edu", 200, b"Signed up"),
+            (NONEXISTENT_SIGNUP, "test@mergington.edu", 404, b"Activity not found"),
+        ],
+        ids=["new_participant", "nonexistent_activity"],
+    )
+    async def test_signup(self, client, url, email, status_code, expected_bytes):
+        """Test the signup response for new participants and unknown activities."""
+        response = await client.post(
+            url,
+            params={"email": email}
         )
-        
-        assert response.status_code == 200
-        result = response.json()
-        assert "message" in result
-        assert "Signed up" in result["message"]
 
-    def test_signup_updates_participant_list(self, client):
+        assert response.status_code == status_code
+        assert expected_bytes in response.content
+
+    async def test_signup_updates_participant_list(self, client):
         """Test that signup adds the participant to the list."""
-        client.post(
-            "/activities/Programming%20Class/signup",
+        await client.post(
+            PROGRAMMING_SIGNUP,
             params={"email": "bob@mergington.edu"}
         )
         
-        response = client.get("/activities")
-        activities = response.json()
+        response = await client.get(ACTIVITIES_URL)
+        activities = _json(response)
         assert "bob@mergington.edu" in activities["Programming Class"]["participants"]
 
-    def test_signup_duplicate_participant(self, client):
+    async def test_signup_duplicate_participant(self, client):
         """Test that signing up a participant twice fails."""
         # First signup
-        client.post(
-            "/activities/Chess%20Club/signup",
+        await client.post(
+            CHESS_SIGNUP,
             params={"email": "test@mergington.edu"}
         )
         
         # Second signup with same email
-        response = client.post(
-            "/activities/Chess%20Club/signup",
+        response = await client.post(
+            CHESS_SIGNUP,
             params={"email": "test@mergington.edu"}
         )
         
         assert response.status_code == 400
-        result = response.json()
-        assert "already signed up" in result["detail"]
-
-    def test_signup_nonexistent_activity(self, client):
-        """Test signing up for a non-existent activity."""
-        response = client.post(
-            "/activities/Nonexistent%20Activity/signup",
-            params={"email": "test@mergington.edu"}
-        )
-        
-        assert response.status_code == 404
-        result = response.json()
-        assert "Activity not found" in result["detail"]
+        assert b"already signed up" in response.content
 
 
 class TestUnregister:
     """Tests for the unregister endpoint."""
 
-    def test_unregister_existing_participant(self, client):
+    async def test_unregister_existing_participant(self, client):
         """Test unregistering an existing participant."""
         # First, sign up a participant
-        client.post(
-            "/activities/Gym%20Class/signup",
+        await client.post(
+            GYM_SIGNUP,
             params={"email": "charlie@mergington.edu"}
         )
         
         # Then unregister
-        response = client.delete(
-            "/activities/Gym%20Class/unregister",
+        response = await client.delete(
+            GYM_UNREGISTER,
             params={"email": "charlie@mergington.edu"}
         )
         
         assert response.status_code == 200
-        result = response.json()
+        result = _json(response)
         assert "Unregistered" in result["message"]
 
-    def test_unregister_removes_participant(self, client):
+    async def test_unregister_removes_participant(self, client, activities):
         """Test that unregister removes the participant from the list."""
         email = "dave@mergington.edu"
-        
+
         # Sign up
-        client.post(
-            "/activities/Chess%20Club/signup",
+        await client.post(
+            CHESS_SIGNUP,
             params={"email": email}
         )
-        
+
         # Verify signup worked
-        response = client.get("/activities")
-        assert email in response.json()["Chess Club"]["participants"]
-        
+        assert email in activities["Chess Club"]["participants"]
+
         # Unregister
-        client.delete(
-            "/activities/Chess%20Club/unregister",
+        await client.delete(
+            CHESS_UNREGISTER,
             params={"email": email}
         )
-        
-        # Verify removal
-        response = client.get("/activities")
-        assert email not in response.json()["Chess Club"]["participants"]
-
-    def test_unregister_nonexistent_participant(self, client):
-        """Test unregistering a participant who is not signed up."""
-        response = client.delete(
-            "/activities/Chess%20Club/unregister",
-            params={"email": "notmember@mergington.edu"}
-        )
-        
-        assert response.status_code == 400
-        result = response.json()
-        assert "not registered" in result["detail"]
 
-    def test_unregister_nonexistent_activity(self, client):
-        """Test unregistering from a non-existent activity."""
-        response = client.delete(
-            "/activities/Nonexistent%20Activity/unregister",
-            params={"email": "test@mergington.edu"}
+        # Verify removal through the API
+        response = await client.get(ACTIVITIES_URL)
+        assert email not in _json(response)["Chess Club"]["participants"]
+
+    @pytest.mark.parametrize(
+        "url, email, status_code, expected_bytes",
+        [
+            (CHESS_UNREGISTER, "notmember@mergington.edu", 400, b"not registered"),
+            (NONEXISTENT_UNREGISTER, "test@mergington.edu", 404, b"Activity not found"),
+        ],
+        ids=["nonexistent_participant", "nonexistent_activity"],
+    )
+    async def test_unregister(self, client, url, email, status_code, expected_bytes):
+        """Test the unregister response for non-members and unknown activities."""
+        response = await client.delete(
+            url,
+            params={"email": email}
         )
-        
-        assert response.status_code == 404
-        result = response.json()
-        assert "Activity not found" in result["detail"]
 
-    def test_unregister_existing_participant_from_original_list(self, client):
+        assert response.status_code == status_code
+        assert expected_bytes in response.content
+
+    async def test_unregister_existing_participant_from_original_list(self, client):
         """Test unregistering one of the original participants."""
-        response = client.delete(
-            "/activities/Chess%20Club/unregister",
+        response = await client.delete(
+            CHESS_UNREGISTER,
             params={"email": "michael@mergington.edu"}
         )
-        
+
         assert response.status_code == 200
-        
+        assert b"Unregistered" in response.content
+
         # Verify removal
-        activities_response = client.get("/activities")
-        assert "michael@mergington.edu" not in activities_response.json()["Chess Club"]["participants"]
+        activities_response = await client.get(ACTIVITIES_URL)
+        assert "michael@mergington.edu" not in _json(activities_response)["Chess Club"]["participants"]
 
 
 class TestActivityConstraints:
     """Tests for activity constraints and business logic."""
 
-    def test_max_participants_not_enforced_on_signup(self, client):
+    async def test_max_participants_not_enforced_on_signup(self, client):
         """Test the current behavior - max participants is not enforced on signup."""
         # This tests the current implementation behavior
         # Sign up multiple participants to an activity
         for i in range(5):
-            response = client.post(
+            response = await client.post(
                 "/activities/Chess%20Class/signup",
                 params={"email": f"participant{i}@mergington.edu"}
             )
             # The current implementation doesn't check max_participants
             assert response.status_code == 200 or response.status_code == 404
 
-    def test_activity_data_consistency(self, client):
+    async def test_activity_data_consistency(self, client, activities):
         """Test that activity data remains consistent through operations."""
         # Get initial state
-        response1 = client.get("/activities")
-        initial_count = len(response1.json()["Programming Class"]["participants"])
-        
+        initial_count = len(activities["Programming Class"]["participants"])
+
         # Add participant
-        client.post(
-            "/activities/Programming%20Class/signup",
+        await client.post(
+            PROGRAMMING_SIGNUP,
             params={"email": "test1@mergington.edu"}
         )
-        
+
         # Check count increased
-        response2 = client.get("/activities")
-        assert len(response2.json()["Programming Class"]["participants"]) == initial_count + 1
-        
+        assert len(activities["Programming Class"]["participants"]) == initial_count + 1
+
         # Remove participant
-        client.delete(
-            "/activities/Programming%20Class/unregister",
+        await client.delete(
+            PROGRAMMING_UNREGISTER,
             params={"email": "test1@mergington.edu"}
         )
-        
-        # Check count back to initial
-        response3 = client.get("/activities")
-        assert len(response3.json()["Programming Class"]["participants"]) == initial_count
+
+        # Check count back to initial through the API
+        response = await client.get(ACTIVITIES_URL)
+        assert len(_json(response)["Programming Class"]["participants"]) == initial_count
@@ -0,0 +1,105 @@
+"""
+Tests for the keyword prefiltering hook in conftest.py.
+"""
+
+from pathlib import Path
+
+import pytest
+
+CONFTEST_SOURCE = (Path(__file__).parent / "conftest.py").read_text()
+
+# Registers an extra keyword the way plugins do, during collection
+EXTRA_KEYWORD_PLUGIN = '''
+def pytest_itemcollected(item):
+    if "flagged" in item.name:
+        item.extra_keyword_matches.add("extra_only")
+'''
+
+# Logs which module's pytest_collection_modifyitems reported each deselection
+DESELECTION_RECORDER = '''
+import sys
+
+def pytest_deselected(items):
+    frame = sys._getframe(1)
+    while frame.f_code.co_name != "pytest_collection_modifyitems":
+        frame = frame.f_back
+    with open("deselected.txt", "a") as log:
+        log.write(f"{frame.f_globals['__name__']} {len(items)}\\n")
+'''
+
+SAMPLE_TESTS = '''
+import pytest
+
+class TestSignup:
+    def test_new_participant(self):
+        pass
+
+    @pytest.mark.parametrize("email", ["alice", "bob"])
+    def test_param(self, email):
+        pass
+
+@pytest.mark.slow
+def test_marked():
+    pass
+
+def test_flagged():
+    pass
+
+def test_attribute():
+    pass
+test_attribute.custom_attr = True
+'''
+
+
+def _selected(pytester, keyword):
+    """Returns the node ids pytest collects for ``-k keyword``."""
+    result = pytester.runpytest(
+        "--collect-only", "-q", "-p", "no:cacheprovider", "-p", "no:asyncio", "-k", keyword
+    )
+    return sorted(line for line in result.outlines if "::" in line)
+
+
+class TestKeywordPrefilter:
+    """Tests for the conftest hook's keyword prefiltering."""
+
+    @pytest.mark.parametrize(
+        "keyword",
+        [
+            "signup",
+            "SIGNUP",
+            "alice",
+            "slow",
+            "extra_only",
+            "custom_attr",
+            "marked",
+            "nomatch",
+            "signup and not param",
+        ],
+    )
+    def test_selection_matches_pytest(self, pytester, keyword):
+        """Test that -k selects identical items with and without the hook."""
+        pytester.makepyfile(test_sample=SAMPLE_TESTS)
+
+        pytester.makeconftest(EXTRA_KEYWORD_PLUGIN)
+        expected = _selected(pytester, keyword)
+
+        pytester.makeconftest(CONFTEST_SOURCE + EXTRA_KEYWORD_PLUGIN)
+        assert _selected(pytester, keyword) == expected
+
+    @pytest.mark.parametrize(
+        "keyword, expected_calls",
+        [
+            ("signup", ["conftest 3"]),
+            ("nomatch", ["conftest 6"]),
+            ("signup and not param", ["_pytest.mark 5"]),
+        ],
+    )
+    def test_prefilter_deselects(self, pytester, keyword, expected_calls):
+        """Test that single-word -k is handled by the hook and other expressions by pytest."""
+        pytester.makepyfile(test_sample=SAMPLE_TESTS)
+        pytester.makeconftest(CONFTEST_SOURCE + DESELECTION_RECORDER)
+
+        _selected(pytester, keyword)
+
+        calls = (pytester.path / "deselected.txt").read_text().splitlines()
+        assert calls == expected_calls